@@ -9,6 +9,7 @@ import yaml
 
 from app.cli import build, cache_teams
 from backend.config import get_config
+from utils import load_yaml
 from utils.manifest import generate_manifest, load_color_overrides
 
 config = get_config()
@@ -43,8 +44,8 @@ def load_team_cache(cache_path: Path) -> dict:
         Parsed cache contents, including each team's colours and crest.
     """
     try:
-        with open(cache_path) as f:
-            return yaml.safe_load(f) or {}
+        with open(cache_path, "rb") as f:
+            return load_yaml(f) or {}
 
     except (FileNotFoundError, yaml.YAMLError) as e:
         print(f"❌ Error loading cache file: {e}")
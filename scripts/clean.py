@@ -1,43 +1,52 @@
 """Cache cleaning script"""
 
+import os
 import shutil
 from pathlib import Path
 
+# Never descended into: nothing in them is ours to clean, and they are large
+SKIP_DIRS = {".git", "node_modules"}
 
-def remove_dirs(root: Path, dir_names: list[str]) -> None:
-    """Remove directories with specified names under the root path
-
-    Args:
-        root: Root directory to start searching from
-        dir_names: List of directory names to remove
-    """
-    for dir in dir_names:
-        for path in root.rglob(dir):
-            if path.is_dir():
-                shutil.rmtree(path, ignore_errors=True)
 
+def clean(root: Path, dir_names: list[str], extensions: list[str]) -> None:
+    """Remove matching directories and files under the root path in one walk
 
-def remove_files(root: Path, extensions: list[str]) -> None:
-    """Remove files with specified extensions under the root path
+    Matched directories are removed without being descended into, so their
+    contents are never listed.
 
     Args:
         root: Root directory to start searching from
+        dir_names: List of directory names to remove
         extensions: List of file extensions to remove
     """
-    for ext in extensions:
-        for file in root.rglob(f"*{ext}"):
-            if file.is_file():
+    dir_targets = set(dir_names)
+    ext_targets = tuple(extensions)
+
+    for dirpath, dirnames, filenames in os.walk(root, topdown=True):
+        for name in dirnames:
+            if name in dir_targets:
+                shutil.rmtree(os.path.join(dirpath, name), ignore_errors=True)
+
+        # Pruning in place stops os.walk descending into removed or skipped dirs
+        dirnames[:] = [
+            name
+            for name in dirnames
+            if name not in dir_targets and name not in SKIP_DIRS
+        ]
+
+        for name in filenames:
+            if name.endswith(ext_targets):
+                file = os.path.join(dirpath, name)
                 try:
-                    file.unlink()
+                    os.unlink(file)
 
                 except OSError as e:
                     print(f"Failed to remove {file}: {e}")
 
 
 if __name__ == "__main__":
-    root = Path(".")
-    remove_dirs(
-        root,
+    clean(
+        Path("."),
         [
             "__pycache__",
             ".ruff_cache",
@@ -45,6 +54,6 @@ if __name__ == "__main__":
             "fixture_fetcher.egg-info",
             "htmlcov",
         ],
+        [".pyc"],
     )
-    remove_files(root, [".pyc"])
     print("Cache cleaned!")
@@ -1,17 +1,83 @@
 """Script to compare static files for changes"""
 
+import hashlib
 import os
-from filecmp import dircmp
+from filecmp import DEFAULT_IGNORES
 from pathlib import Path
 
+# Calendars are compared by event in compare_calendars.py instead. The manifest
+# (calendars.json) is deliberately still compared here, so a change to it alone
+# redeploys the site.
+SKIP = frozenset({"calendars"})
 
-def compare_directories(old_dir: Path | None, new_dir: Path | None) -> bool:
+# Ignored at every level, as filecmp.dircmp does, so public-old's .git is left out
+IGNORE = frozenset(DEFAULT_IGNORES)
+
+CHUNK_SIZE = 1 << 20
+
+
+def _hash_file(path: str) -> bytes:
+    """Hash a file's contents, streaming it in chunks.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        A 128-bit BLAKE2b digest of the contents.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb", buffering=0) as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+
+    return digest.digest()
+
+
+def _stat_tree(
+    root: Path, skip: frozenset[str] = frozenset()
+) -> dict[str, tuple[int, int] | None]:
+    """Map everything under a directory to its size and modification time.
+
+    Args:
+        root: The directory to walk.
+        skip: Top-level names to leave out.
+
+    Returns:
+        Mapping of path relative to root to (size, mtime_ns) for files, or None
+        for directories so an empty directory still counts.
+    """
+    tree: dict[str, tuple[int, int] | None] = {}
+    pending = [("", str(root))]
+
+    while pending:
+        rel_dir, abs_dir = pending.pop()
+        with os.scandir(abs_dir) as entries:
+            for entry in entries:
+                if entry.name in IGNORE or (not rel_dir and entry.name in skip):
+                    continue
+
+                rel = rel_dir + entry.name
+                if entry.is_dir():
+                    tree[rel] = None
+                    pending.append((rel + "/", entry.path))
+
+                elif entry.is_file():
+                    stat = entry.stat()
+                    tree[rel] = (stat.st_size, stat.st_mtime_ns)
+
+    return tree
+
+
+def compare_directories(
+    old_dir: Path | None, new_dir: Path | None, skip: frozenset[str] = frozenset()
+) -> bool:
     """
     Compare two directories recursively.
 
     Args:
         old_dir: The old directory to compare.
         new_dir: The new directory to compare.
+        skip: Top-level names to leave out of the comparison.
 
     Returns:
         True if there are differences, False if identical.
@@ -27,19 +93,26 @@ def compare_directories(old_dir: Path | None, new_dir: Path | None) -> bool:
     ):
         return True
 
-    dcmp = dircmp(str(old_dir), str(new_dir))
+    old_tree = _stat_tree(old_dir, skip)
+    new_tree = _stat_tree(new_dir, skip)
 
-    # If there are any differences in files or subdirectories
-    if dcmp.left_only or dcmp.right_only or dcmp.diff_files:
+    if old_tree.keys() != new_tree.keys():
         return True
 
-    # Recursively check subdirectories
-    for common_dir in dcmp.common_dirs:
-        if (
-            old_dir is not None
-            and new_dir is not None
-            and compare_directories(old_dir / common_dir, new_dir / common_dir)
-        ):
+    for rel, old_stat in old_tree.items():
+        new_stat = new_tree[rel]
+
+        # Same size and mtime is trusted as unchanged, as dircmp's shallow compare
+        # did, so an untouched tree is never read
+        if old_stat == new_stat:
+            continue
+
+        if old_stat is None or new_stat is None or old_stat[0] != new_stat[0]:
+            return True
+
+        # A fresh checkout bumps every mtime, so equal sizes fall back to content
+        old_hash = _hash_file(os.path.join(old_dir, rel))
+        if old_hash != _hash_file(os.path.join(new_dir, rel)):
             return True
 
     return False
@@ -50,30 +123,7 @@ if __name__ == "__main__":
     new_dir = Path("public")
 
     # Check static files
-    static_changed = False
-
-    if old_dir.exists() and new_dir.exists():
-        dcmp = dircmp(str(old_dir), str(new_dir))
-
-        if dcmp.left_only or dcmp.right_only:
-            static_changed = any(
-                name != "calendars" for name in dcmp.left_only + dcmp.right_only
-            )
-
-        if dcmp.diff_files:
-            static_changed = True
-
-        # Recursively check subdirectories (excluding calendars)
-        for common_dir in dcmp.common_dirs:
-            if common_dir != "calendars":
-                old_subdir = old_dir / common_dir
-                new_subdir = new_dir / common_dir
-                if compare_directories(old_subdir, new_subdir):
-                    static_changed = True
-                    break
-
-    else:
-        static_changed = True
+    static_changed = compare_directories(old_dir, new_dir, skip=SKIP)
 
     output = os.environ.get("GITHUB_OUTPUT")
     if output:
@@ -2,10 +2,9 @@
 
 from pathlib import Path
 
-import yaml
-
 from backend import FootballDataRepository
 from logic.fixtures.filters import Filter
+from utils import dump_yaml
 
 team = "Manchester United FC"
 
@@ -23,5 +22,6 @@ for f in fixtures:
         "tv": "",
     }
 
-Path("data/tv_overrides.yaml").write_text(yaml.safe_dump(output))
+# Kept in kick-off order so the template reads like a fixture list
+Path("data/tv_overrides.yaml").write_text(dump_yaml(output, sort_keys=False))
 print("Wrote overrides template to data/tv_overrides.yaml")
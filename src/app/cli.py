@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
+import functools
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import yaml
+
 from backend import FootballDataRepository
 from backend.config import get_config
 from backend.storage.snapshot import diff_changes, load_snapshot, save_snapshot
 from logic.calendar.ics_writer import ICSWriter
 from logic.fixtures.enrich import enrich_all
 from logic.fixtures.filters import Filter
+from logic.fixtures.models import Fixture
 from utils import (
     CalendarError,
     FFLogger,
     InvalidInputError,
     TeamNotFoundError,
     TeamsCacheError,
+    load_yaml,
     slugify,
 )
 
@@ -28,11 +36,147 @@ TV_OVERRIDES_PATH = Path(
     config.get("TV_OVERRIDES_PATH", "data/overrides/tv_overrides.yaml")
 )
 
+# Upper bound on teams built at once, to stay polite to the disk and the API
+MAX_WORKERS = 8
+
 
 # Kept as an alias so slugs stay identical to the ones the manifest matches against
 _slug = slugify
 
 
+def _build_one_team(
+    t: str,
+    repo: FootballDataRepository,
+    comps: list[str],
+    season: int | None,
+    home_only: bool,
+    away_only: bool,
+    televised_only: bool,
+    output: Path,
+    overrides: Path | None,
+    cache_dir: Path,
+    summarise: bool,
+) -> tuple[list[tuple[str, str]], list[tuple[str, str]], list[str]]:
+    """Build the ICS calendars for a single team.
+
+    Each team writes only to its own output and snapshot paths, so teams can be
+    built concurrently against a shared repository.
+
+    Args:
+        t: Team name to build calendars for.
+        repo: Repository to fetch fixtures from.
+        comps: Competition codes to filter fixtures.
+        season: Season year.
+        home_only: Whether to include only home fixtures.
+        away_only: Whether to include only away fixtures.
+        televised_only: Whether to include only fixtures with TV info.
+        output: Output directory for ICS files.
+        overrides: Overrides YAML file path.
+        cache_dir: Directory holding the fixture snapshots.
+        summarise: Whether to print a summary of changes.
+
+    Returns:
+        The team's (team_name, competition_code) successes, its
+        (team_name, error_message) failures and its summary messages. Messages are
+        returned rather than printed so each team's lines stay together when teams
+        are built concurrently.
+    """
+    successful = []
+    failed = []
+    messages = []
+
+    try:
+        league, short_name = get_team_info(t)
+
+    except (TeamNotFoundError, TeamsCacheError) as e:
+        error_msg = str(e)
+        logger.error(f"Failed to build ICS for team '{t}': {error_msg}")
+        failed.append((t, error_msg))
+        return successful, failed, messages
+
+    try:
+        league_slug = _slug(league)
+        team_slug = _slug(short_name)
+        team_output_dir = output / league_slug / team_slug
+        team_snapshot_dir = cache_dir / "snapshots" / league_slug / team_slug
+
+        fixtures = repo.fetch_fixtures(t, comps, season)
+        fixtures = Filter.apply_filters(fixtures, upcoming_only=True)
+
+        fixtures_by_comp: defaultdict[str, list[Fixture]] = defaultdict(list)
+        for fixture in fixtures:
+            fixtures_by_comp[fixture.competition_code].append(fixture)
+
+        for comp_code, comp_fixtures in fixtures_by_comp.items():
+            if not comp_fixtures:
+                logger.warning(
+                    f"No '{comp_code}' fixtures found for '{short_name}', skipping..."
+                )
+                continue
+
+            try:
+                comp_name = comp_fixtures[0].competition
+                comp_code_slug = _slug(comp_code)
+
+                snap_path = team_snapshot_dir / f"{team_slug}.{comp_code_slug}.json"
+                prev = load_snapshot(snap_path)
+
+                stats = enrich_all(comp_fixtures, overrides_path=overrides)
+
+                # Applied after enrichment so TV overrides count as televised. The
+                # filters build a new list, so comp_fixtures is still diffed and
+                # snapshotted in full
+                filtered_fixtures = comp_fixtures
+                if home_only or away_only or televised_only:
+                    filtered_fixtures = Filter.apply_filters(
+                        comp_fixtures,
+                        home_only=home_only,
+                        away_only=away_only,
+                        televised_only=televised_only,
+                    )
+
+                # ICSWriter.write creates team_output_dir on first use
+                fname = f"{team_slug}.{comp_code_slug}.ics"
+                writer = ICSWriter(filtered_fixtures)
+                output_file = writer.write(team_output_dir / fname)
+                logger.info(
+                    f"Wrote {len(filtered_fixtures)} fixtures for team '{short_name}' in {comp_code} to {output_file}"
+                )
+                successful.append((short_name, comp_code))
+
+                if summarise:
+                    changes = diff_changes(comp_fixtures, prev)
+                    messages.append(
+                        f"[{short_name}] - {comp_code} fixtures: {len(comp_fixtures)}\n"
+                        f"🔄 Changes since last update: {changes['time']} time, {changes['venue']} venue, {changes['status']} status\n"
+                        f"📺 TV info added: {stats['tv_overrides_applied']}"
+                    )
+
+                save_snapshot(comp_fixtures, snap_path, previous=prev)
+
+            except Exception as e:
+                raise CalendarError(
+                    f"Failed to build calendar for {comp_name}",
+                    context={
+                        "team": short_name,
+                        "competition": comp_name,
+                        "error": str(e),
+                    },
+                ) from e
+
+    except CalendarError as e:
+        error_msg = str(e)
+        logger.error(f"Failed to build ICS for team '{short_name}': {error_msg}")
+        failed.append((short_name, error_msg))
+
+    except Exception as e:
+        error_msg = str(e)
+        logger.exception(f"Failed to build ICS for team '{short_name}': {error_msg}")
+        failed.append((short_name, error_msg))
+
+    return successful, failed, messages
+
+
 def build(
     teams: list[str],
     competitions: list[str] | None = None,
@@ -74,117 +218,59 @@ def build(
         If neither team nor all_teams is specified.
     """
     output.mkdir(parents=True, exist_ok=True)
-    comps = [c.strip() for c in competitions if c.strip()] if competitions else []
+    comps = [s for c in competitions if (s := c.strip())] if competitions else []
 
     repo = FootballDataRepository()
 
-    if refresh_cache or not CACHE_PATH.exists():
+    if refresh_cache:
         repo.client.refresh_team_cache()
 
+    else:
+        # Parsing up front doubles as the existence check, and leaves the parse
+        # memoised before the team threads start looking teams up in it
+        try:
+            stat = CACHE_PATH.stat()
+            _load_teams_cache(str(CACHE_PATH), stat.st_mtime_ns, stat.st_size)
+
+        except FileNotFoundError:
+            repo.client.refresh_team_cache()
+
+        except yaml.YAMLError:
+            pass  # Reported against each team by get_team_info
+
     if not teams:
         raise InvalidInputError("Team(s) must be specified")
 
-    teams = [t.strip() for t in teams if t.strip()]
+    # A repeated team would be built on two threads writing the same files
+    teams = list(dict.fromkeys(s for t in teams if (s := t.strip())))
+
+    build_team = functools.partial(
+        _build_one_team,
+        repo=repo,
+        comps=comps,
+        season=season,
+        home_only=home_only,
+        away_only=away_only,
+        televised_only=televised_only,
+        output=output,
+        overrides=overrides,
+        cache_dir=cache_dir,
+        summarise=summarise,
+    )
 
     successful = []
     failed = []
 
-    for t in teams:
-        try:
-            league, short_name = get_team_info(t)
+    # Per-team work is mostly file and network I/O, so threads overlap it well;
+    # map keeps the results in the order the teams were given
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(teams)))) as ex:
+        for team_successful, team_failed, messages in ex.map(build_team, teams):
+            successful.extend(team_successful)
+            failed.extend(team_failed)
 
-        except (TeamNotFoundError, TeamsCacheError) as e:
-            error_msg = str(e)
-            logger.error(f"Failed to build ICS for team '{t}': {error_msg}")
-            failed.append((t, error_msg))
-            continue
-
-        try:
-            league_slug = _slug(league)
-
-            fixtures = repo.fetch_fixtures(t, comps, season)
-            fixtures = Filter.apply_filters(fixtures, upcoming_only=True)
-
-            fixtures_by_comp = {}
-            for fixture in fixtures:
-                comp_code = fixture.competition_code
-                if comp_code not in fixtures_by_comp:
-                    fixtures_by_comp[comp_code] = []
-                fixtures_by_comp[comp_code].append(fixture)
-
-            for comp_code, comp_fixtures in fixtures_by_comp.items():
-                if not comp_fixtures:
-                    logger.warning(
-                        f"No '{comp_code}' fixtures found for '{short_name}', skipping..."
-                    )
-                    continue
-
-                try:
-                    comp_name = comp_fixtures[0].competition
-                    team_slug = _slug(short_name)
-                    comp_code_slug = _slug(comp_code)
-
-                    snap_path = (
-                        cache_dir
-                        / "snapshots"
-                        / league_slug
-                        / team_slug
-                        / f"{team_slug}.{comp_code_slug}.json"
-                    )
-                    prev = load_snapshot(snap_path)
-
-                    stats = enrich_all(comp_fixtures, overrides_path=overrides)
-
-                    filtered_fixtures = comp_fixtures[:]
-                    if home_only:
-                        filtered_fixtures = Filter.only_home(filtered_fixtures)
-                    if away_only:
-                        filtered_fixtures = Filter.only_away(filtered_fixtures)
-                    if televised_only:
-                        filtered_fixtures = Filter.only_televised(filtered_fixtures)
-
-                    team_output_dir = output / league_slug / team_slug
-                    team_output_dir.mkdir(parents=True, exist_ok=True)
-
-                    fname = f"{team_slug}.{comp_code_slug}.ics"
-                    writer = ICSWriter(filtered_fixtures)
-                    output_file = writer.write(team_output_dir / fname)
-                    logger.info(
-                        f"Wrote {len(filtered_fixtures)} fixtures for team '{short_name}' in {comp_code} to {output_file}"
-                    )
-                    successful.append((short_name, comp_code))
-
-                    if summarise:
-                        changes = diff_changes(comp_fixtures, prev)
-                        print(
-                            f"[{short_name}] - {comp_code} fixtures: {len(comp_fixtures)}\n"
-                            f"🔄 Changes since last update: {changes['time']} time, {changes['venue']} venue, {changes['status']} status\n"
-                            f"📺 TV info added: {stats['tv_overrides_applied']}"
-                        )
-
-                    save_snapshot(comp_fixtures, snap_path)
-
-                except Exception as e:
-                    raise CalendarError(
-                        f"Failed to build calendar for {comp_name}",
-                        context={
-                            "team": short_name,
-                            "competition": comp_name,
-                            "error": str(e),
-                        },
-                    ) from e
-
-        except CalendarError as e:
-            error_msg = str(e)
-            logger.error(f"Failed to build ICS for team '{short_name}': {error_msg}")
-            failed.append((short_name, error_msg))
-
-        except Exception as e:
-            error_msg = str(e)
-            logger.exception(
-                f"Failed to build ICS for team '{short_name}': {error_msg}"
-            )
-            failed.append((short_name, error_msg))
+            # One write per team, in team order, however the threads finish
+            if messages:
+                sys.stdout.write("\n".join(messages) + "\n")
 
     return {
         "successful": successful,
@@ -204,11 +290,51 @@ def cache_teams(
         output: Path to cache the team data.
     """
     repo = FootballDataRepository()
-    comps = [c.strip() for c in competitions if c.strip()]
+    comps = [s for c in competitions if (s := c.strip())]
     repo.client.refresh_team_cache(comps, cache_path=output)
     print("✅ Cached teams successfully")
 
 
+@functools.lru_cache(maxsize=8)
+def _load_teams_cache(
+    path_str: str, mtime_ns: int, size: int
+) -> dict[str, tuple[str, str | None]]:
+    """Parse the team cache into a team lookup, memoised until the file changes.
+
+    A multi-team build looks every team up in the same file, so only the first
+    lookup pays for the parse and the flattening. The result is shared, so callers
+    must not mutate it.
+
+    Args:
+        path_str: Path to the team cache file.
+        mtime_ns: Modification time of the file, so a rewrite invalidates the entry.
+        size: Size of the file, in case a rewrite lands within the same mtime tick.
+
+    Returns:
+        Mapping of team name to its league and short name, or None for the short
+        name where the cache has none. Where a team appears in several leagues,
+        the first listed is its primary league.
+    """
+    with open(path_str, "rb") as f:
+        data = load_yaml(f) or {}
+
+    index: dict[str, tuple[str, str | None]] = {}
+
+    for league, teams in data.items():
+        if not isinstance(teams, dict):
+            logger.warning(
+                f"Invalid cache structure for league '{league}': expected dict, got {type(teams).__name__}"
+            )
+            continue
+
+        for name, info in teams.items():
+            if name not in index:
+                short_name = info.get("short_name") if isinstance(info, dict) else None
+                index[name] = (league, short_name)
+
+    return index
+
+
 def get_team_info(team_name: str, cache_path: Path = CACHE_PATH) -> tuple[str, str]:
     """Get the primary league and short name for a given team.
 
@@ -223,11 +349,9 @@ def get_team_info(team_name: str, cache_path: Path = CACHE_PATH) -> tuple[str, s
         TeamNotFoundError: If the team is not found in the cache.
         TeamsCacheError: If there is an error loading the cache.
     """
-    import yaml
-
     try:
-        with open(cache_path) as f:
-            teams_data = yaml.safe_load(f) or {}
+        stat = cache_path.stat()
+        teams_index = _load_teams_cache(str(cache_path), stat.st_mtime_ns, stat.st_size)
 
     except (FileNotFoundError, yaml.YAMLError) as e:
         raise TeamsCacheError(
@@ -235,25 +359,15 @@ def get_team_info(team_name: str, cache_path: Path = CACHE_PATH) -> tuple[str, s
             context={"error": str(e), "cache_path": str(cache_path)},
         )
 
-    for league, teams in teams_data.items():
-        if not isinstance(teams, dict):
+    if team_name in teams_index:
+        league, short_name = teams_index[team_name]
+        if short_name is None:
             logger.warning(
-                f"Invalid cache structure for league '{league}': expected dict, got {type(teams).__name__}"
+                f"No short name found for team '{team_name}' in league '{league}'"
             )
-            continue
-
-        if team_name in teams:
-            team_info = teams[team_name]
             short_name = team_name  # Default to team_name
-            if isinstance(team_info, dict) and "short_name" in team_info:
-                short_name = team_info["short_name"]
-
-            else:
-                logger.warning(
-                    f"No short name found for team '{team_name}' in league '{league}'"
-                )
 
-            return league, short_name
+        return league, short_name
 
     raise TeamNotFoundError(
         f"Team '{team_name}' not found in cache",
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import datetime as dt
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, cast
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from backend.config import get_config
 from logic.fixtures.models import Fixture
@@ -23,6 +28,8 @@ from utils import (
     ServiceUnavailableError,
     TimeoutError,
     UnknownAPIError,
+    dump_yaml,
+    load_yaml,
 )
 
 logger = FFLogger.get_logger(__name__)
@@ -32,9 +39,28 @@ API = config["FOOTBALL_DATA_API"]
 FOOTBALL_DATA_API_TOKEN = config["FOOTBALL_DATA_API_TOKEN"]
 CACHE_PATH = Path(config["CACHE_PATH"])
 COMP_CODES = config.get("FD_COMPETITIONS", {"PL": "Premier League"})
+# Searched when a caller names no competitions; built once rather than per call
+DEFAULT_COMP_CODES = tuple(COMP_CODES)
 
 REQUEST_TIMEOUT = 30
 
+# fromisoformat() accepts a trailing "Z" from Python 3.11, so the API's UTC
+# timestamps only need rewriting on 3.10
+_ISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+# Upper bound on simultaneous requests, kept low for the free tier's rate limit
+MAX_CONCURRENT_REQUESTS = 4
+
+# Transient failures are retried by urllib3 with exponential backoff, honouring
+# Retry-After on 429s. Once retries run out the last response is returned, so
+# _handle_response still maps it to a typed error. Jitter spreads out retries
+# from concurrent requests that failed together
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 1.0
+RETRY_BACKOFF_MAX = 30
+RETRY_BACKOFF_JITTER = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
 HTTP_ERROR_MAP: dict[int, tuple] = {
     404: (NotFoundError, "warning"),
     429: (RateLimitError, "warning"),
@@ -63,9 +89,30 @@ class FDClient:
         self.token = {"X-Auth-Token": token}
         self.session = requests.Session()
         self.session.headers.update(self.token)
+
+        # One pooled adapter keeps connections alive across every request in a run
+        # Read timeouts are not retried: a hung API should fail after one
+        # REQUEST_TIMEOUT, and read=False re-raises the timeout unwrapped so it
+        # still surfaces as TimeoutError
+        retry = Retry(
+            total=MAX_RETRIES,
+            read=False,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            backoff_max=RETRY_BACKOFF_MAX,
+            backoff_jitter=RETRY_BACKOFF_JITTER,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         self.cache_path = CACHE_PATH
         self.cache = self._load_cache()
         self._matches_cache: dict[tuple[str, int | None], tuple[dict, list[dict]]] = {}
+        self._team_matches: dict[tuple[str, int | None], dict[int, list[dict]]] = {}
+        self._team_names: dict[tuple[str, int | None], dict[str, dict]] = {}
         self._index: dict[str, dict] | None = None
         logger.debug("FDClient initialised successfully")
 
@@ -107,7 +154,7 @@ class FDClient:
         """
         if self.cache_path.exists() and self.cache_path.is_file():
             try:
-                data = yaml.safe_load(self.cache_path.read_text()) or {}
+                data = load_yaml(self.cache_path.read_bytes()) or {}
                 num_teams = sum(
                     len(teams) if isinstance(teams, dict) else 0
                     for teams in data.values()
@@ -143,9 +190,8 @@ class FDClient:
                     )
                     return
 
-            self.cache_path.write_text(yaml.safe_dump(self.cache, sort_keys=True))
+            self.cache_path.write_text(dump_yaml(self.cache, sort_keys=True))
             logger.debug("Cache saved successfully")
-            print("💾 Saved team cache successfully")
 
         except yaml.YAMLError as e:
             logger.error(f"Failed to save cache: {e}")
@@ -182,6 +228,44 @@ class FDClient:
         self._index = None
         self._save_cache()
 
+    def _fetch_competition_teams(self, code: str) -> tuple[str, dict[str, Any]]:
+        """Fetch the teams in a competition for the team cache.
+
+        Args:
+            code: Competition code (e.g. 'PL').
+
+        Returns:
+            A tuple of (league name, dictionary mapping team names to their info).
+
+        Raises:
+            ConnectionError: If the teams could not be fetched.
+        """
+        try:
+            response = self.session.get(
+                f"{API}competitions/{code}/teams", headers=self.token, timeout=30
+            )
+            response.raise_for_status()
+            data = self._handle_response(response, f"teams for competition {code}")
+
+            teams = {
+                team["name"]: {
+                    "id": team["id"],
+                    "short_name": team.get("shortName", team["name"]),
+                    "venue": team.get("venue"),
+                    "club_colors": team.get("clubColors"),
+                    "crest": team.get("crest"),
+                }
+                for team in data.get("teams", [])
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to refresh team cache: {e}")
+            raise ConnectionError(
+                f"Failed to refresh team cache for competition {code}: {e}"
+            ) from e
+
+        return COMP_CODES.get(code, code), teams
+
     def refresh_team_cache(
         self, competitions: list[str] | None = None, cache_path: Path | None = None
     ) -> None:
@@ -194,35 +278,15 @@ class FDClient:
         if cache_path:
             self.cache_path = cache_path
 
-        comps = competitions if competitions else list(COMP_CODES.keys())
+        comps = competitions or DEFAULT_COMP_CODES
         all_teams: dict[str, Any] = {}
 
-        for code in comps:
-            try:
-                response = self.session.get(
-                    f"{API}competitions/{code}/teams", headers=self.token, timeout=30
-                )
-                response.raise_for_status()
-                data = self._handle_response(response, f"teams for competition {code}")
-
-                league_name = COMP_CODES.get(code, code)
-                if league_name not in all_teams:
-                    all_teams[league_name] = {}
-
-                for team in data.get("teams", []):
-                    all_teams[league_name][team["name"]] = {
-                        "id": team["id"],
-                        "short_name": team.get("shortName", team["name"]),
-                        "venue": team.get("venue"),
-                        "club_colors": team.get("clubColors"),
-                        "crest": team.get("crest"),
-                    }
-
-            except Exception as e:
-                logger.error(f"Failed to refresh team cache: {e}")
-                raise ConnectionError(
-                    f"Failed to refresh team cache for competition {code}: {e}"
-                ) from e
+        # Competitions are independent requests, so they are fetched concurrently.
+        # map() keeps competition order and re-raises the first failure here
+        workers = max(1, min(MAX_CONCURRENT_REQUESTS, len(comps)))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for league_name, teams in ex.map(self._fetch_competition_teams, comps):
+                all_teams.setdefault(league_name, {}).update(teams)
 
         if all_teams:
             # Merge per league so refreshing one competition leaves the others intact
@@ -235,11 +299,9 @@ class FDClient:
             logger.info(
                 f"Refreshed team cache with {num_teams} teams across {len(all_teams)} league(s)"
             )
-            print(f"🔄 Refreshed team cache with {num_teams} teams")
 
         else:
             logger.warning("No teams fetched to refresh cache")
-            print("⚠️ No teams fetched to refresh cache")
 
     def _handle_response(self, response: requests.Response, context: str = "") -> dict:
         """Handle API response and raise appropriate exceptions.
@@ -321,8 +383,8 @@ class FDClient:
         context = f"matches for competition {comp_code}"
 
         try:
+            logger.info(f"Fetching all {comp_code} matches")
             logger.debug(f"Fetching {context} with params: {params}")
-            print(f"📡 Fetching all {comp_code} matches...")
             response = self.session.get(
                 f"{API}competitions/{comp_code}/matches",
                 params=params,
@@ -352,32 +414,86 @@ class FDClient:
         logger.info(f"Fetched {len(matches)} {comp_code} matches in one request")
         return comp_meta, matches
 
-    @staticmethod
-    def _find_team_in_matches(matches: list[dict], team_name: str) -> dict | None:
-        """Find a team in a competition's matches by name, short name or TLA.
+    def _matches_by_team(
+        self, comp_code: str, season: int | None = None
+    ) -> dict[int, list[dict]]:
+        """Index a competition's matches by the ID of each team playing in them.
+
+        Built once per (competition, season) alongside the memoised payload, so each
+        team in a build is a dictionary lookup rather than a scan of every match.
 
         Args:
-            matches: Raw match dictionaries from the API.
-            team_name: Name of the team to search for.
+            comp_code: Competition code (e.g. 'PL').
+            season: Season year to filter matches.
 
         Returns:
-            The matching team dictionary, or None if not present.
+            A dictionary mapping team IDs to their matches, in payload order.
         """
-        wanted = team_name.lower()
-        if not wanted:
-            return None
+        key = (comp_code, season)
+        index = self._team_matches.get(key)
+        if index is not None:
+            return index
+
+        comp_meta, matches = self.fetch_competition_matches(comp_code, season)
+        index = {}
+
+        for m in matches:
+            comp = m.get("competition") or comp_meta
+
+            # Belt-and-braces: the endpoint is competition-scoped already
+            if comp.get("code") and comp["code"] != comp_code:
+                logger.debug(
+                    f"Skipping match {m['id']} - competition {comp['code']} "
+                    f"not in allowed set"
+                )
+                continue
+
+            for side in ("homeTeam", "awayTeam"):
+                team_id = m[side].get("id")
+                if team_id is not None:
+                    index.setdefault(team_id, []).append(m)
+
+        self._team_matches[key] = index
+        logger.debug(f"Indexed {len(matches)} {comp_code} matches by team")
+        return index
+
+    def _teams_by_name(
+        self, comp_code: str, season: int | None = None
+    ) -> dict[str, dict]:
+        """Index the teams in a competition's matches by name, short name and TLA.
+
+        Built once per (competition, season), so resolving several teams against
+        the same payload is a dictionary lookup each rather than a scan.
+
+        Args:
+            comp_code: Competition code (e.g. 'PL').
+            season: Season year to filter matches.
+
+        Returns:
+            A dictionary mapping lowercased names to team dictionaries. Where two
+            teams share a name, the first to appear in the payload wins.
+        """
+        key = (comp_code, season)
+        index = self._team_names.get(key)
+        if index is not None:
+            return index
+
+        _, matches = self.fetch_competition_matches(comp_code, season)
+        index = {}
 
         for m in matches:
             for side in ("homeTeam", "awayTeam"):
                 team = m.get(side) or {}
-                names = {
-                    str(team.get(key) or "").lower()
-                    for key in ("name", "shortName", "tla")
-                }
-                if wanted in names - {""} and team.get("id") is not None:
-                    return team
+                if team.get("id") is None:
+                    continue
+
+                for field in ("name", "shortName", "tla"):
+                    name = str(team.get(field) or "").lower()
+                    if name:
+                        index.setdefault(name, team)
 
-        return None
+        self._team_names[key] = index
+        return index
 
     def get_team_id_by_name(
         self,
@@ -407,12 +523,11 @@ class FDClient:
         if info is not None:
             return int(info["id"])
 
-        comps = competitions if competitions else list(COMP_CODES.keys())
-        print(f"🔍 {team_name} not found in cache - resolving from match data...")
+        comps = competitions or DEFAULT_COMP_CODES
+        logger.info(f"'{team_name}' not found in cache, resolving from match data")
 
         for code in comps:
-            _, matches = self.fetch_competition_matches(code, season)
-            team = self._find_team_in_matches(matches, team_name)
+            team = self._teams_by_name(code, season).get(team_name.lower())
             if team is None:
                 continue
 
@@ -426,7 +541,6 @@ class FDClient:
             logger.info(
                 f"Resolved and cached team ID for '{team_name}' from {code}: {team_id}"
             )
-            print(f"🔄 Resolved and cached team ID for '{team_name}': {team_id}")
             return team_id
 
         logger.error(f"Team '{team_name}' not found in competitions {comps}")
@@ -450,11 +564,11 @@ class FDClient:
         match_id = str(m["id"])
 
         try:
-            utc_kickoff = (
-                dt.datetime.fromisoformat(m["utcDate"].replace("Z", "+00:00"))
-                if m.get("utcDate")
-                else None
-            )
+            utc_date = m.get("utcDate")
+            if utc_date and not _ISO_HANDLES_Z and utc_date.endswith("Z"):
+                utc_date = f"{utc_date[:-1]}+00:00"
+
+            utc_kickoff = dt.datetime.fromisoformat(utc_date) if utc_date else None
 
         except (ValueError, KeyError) as e:
             logger.warning(f"Failed to parse kickoff time for match {match_id}: {e}")
@@ -500,36 +614,23 @@ class FDClient:
             List of fixtures for the specified team.
         """
         logger.info(f"Fetching fixtures for team: {team_name}")
-        comps = competitions if competitions else list(COMP_CODES.keys())
-        team_id = self.get_team_id_by_name(team_name, comps, season)
-
-        info = self._team_index().get(team_name.lower())
-        display_name = (info.get("short_name") if info else None) or team_name
+        comps = competitions or DEFAULT_COMP_CODES
+        team_id = self.get_team_id_by_name(team_name, competitions, season)
 
         fixtures: list[Fixture] = []
 
         for code in comps:
-            comp_meta, matches = self.fetch_competition_matches(code, season)
-            logger.debug(f"Filtering {len(matches)} {code} matches for '{team_name}'")
-
-            for m in matches:
-                comp = m.get("competition") or comp_meta
-
-                # Belt-and-braces: the endpoint is competition-scoped already
-                if comp.get("code") and comp["code"] != code:
-                    logger.debug(
-                        f"Skipping match {m['id']} - competition {comp['code']} "
-                        f"not in allowed set"
-                    )
-                    continue
-
-                if team_id not in (m["homeTeam"].get("id"), m["awayTeam"].get("id")):
-                    continue
-
-                fixtures.append(self._to_fixture(m, team_id, comp_meta, code))
+            comp_meta, _ = self.fetch_competition_matches(code, season)
+            logger.debug(f"Looking up {code} matches for '{team_name}'")
+
+            # extend() with a generator avoids re-resolving fixtures.append per match
+            to_fixture = self._to_fixture
+            fixtures.extend(
+                to_fixture(m, team_id, comp_meta, code)
+                for m in self._matches_by_team(code, season).get(team_id, ())
+            )
 
         logger.info(f"Fetched {len(fixtures)} fixtures for team '{team_name}'")
-        print(f"📅 Fetched {len(fixtures)} fixtures for {display_name}")
         return fixtures
 
 
@@ -543,6 +644,7 @@ class FootballDataRepository:
             client: An optional FDClient instance. If not provided, a new one is created.
         """
         self.client = client or FDClient()
+        self._lock = threading.Lock()
 
     def fetch_fixtures(
         self,
@@ -560,8 +662,12 @@ class FootballDataRepository:
         Returns:
             A list of Fixture objects matching the criteria.
         """
-        return self.client.fetch_fixtures(
-            team_name,
-            competitions,
-            season,
-        )
+        # Builds share one repository across threads; serialising here stops two
+        # teams fetching the same competition at once, and once it is memoised
+        # the work left under the lock is an in-memory lookup
+        with self._lock:
+            return self.client.fetch_fixtures(
+                team_name,
+                competitions,
+                season,
+            )
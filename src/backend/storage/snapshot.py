@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
+import os
+import uuid
+from dataclasses import fields
 from pathlib import Path
 from typing import cast
 
@@ -13,6 +15,10 @@ from utils import DataProcessingError, FFLogger
 
 logger = FFLogger.get_logger(__name__)
 
+# Fixture is flat, so reading its fields directly matches asdict without the
+# recursive deep copy asdict makes of every value
+_FIXTURE_FIELDS = tuple(f.name for f in fields(Fixture))
+
 
 def _fixture_to_dict(fixture: Fixture) -> dict:
     """Convert a Fixture object to a dictionary for snapshotting.
@@ -23,7 +29,7 @@ def _fixture_to_dict(fixture: Fixture) -> dict:
     Returns:
         A dictionary representation of the Fixture.
     """
-    dict = asdict(fixture)
+    dict = {name: getattr(fixture, name) for name in _FIXTURE_FIELDS}
     dict["utc_kickoff"] = (
         fixture.utc_kickoff.isoformat() if fixture.utc_kickoff else None
     )
@@ -47,21 +53,54 @@ def _dict_to_key_fields(d: dict) -> tuple[str, str, str, str]:
     )
 
 
-def save_snapshot(fixtures: list[Fixture], path: Path) -> None:
+def save_snapshot(
+    fixtures: list[Fixture], path: Path, previous: dict[str, dict] | None = None
+) -> None:
     """Save a snapshot of fixtures to a JSON file.
 
     Args:
         fixtures: The list of Fixture objects to snapshot.
         path: The path to the JSON file to save the snapshot.
+        previous: The snapshot already on disk, as returned by load_snapshot. If
+            not given, the file is read and compared byte for byte instead. Either
+            way an identical snapshot leaves the file untouched.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
     snapshot = {f.id: _fixture_to_dict(f) for f in fixtures}
 
+    if previous is not None and snapshot == previous:
+        logger.debug(f"Snapshot unchanged, skipping write to {path}")
+        return
+
+    # Sorted keys make the bytes canonical, so reruns produce identical files and
+    # an unchanged snapshot can be spotted without parsing the old one
+    payload = orjson.dumps(snapshot, option=orjson.OPT_SORT_KEYS)
+
+    if previous is None:
+        try:
+            if path.read_bytes() == payload:
+                logger.debug(f"Snapshot unchanged, skipping write to {path}")
+                return
+
+        except OSError:
+            pass  # Missing or unreadable, so write it afresh
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Written beside the target then renamed over it, so an interrupted build never
+    # leaves a half-written snapshot for the next one to misread as empty. The temp
+    # name is unique, so concurrent saves to one path never share a temp file, and
+    # opening it with plain open() keeps the usual umask-based file mode
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+
     try:
-        path.write_bytes(orjson.dumps(snapshot))
+        with open(tmp_path, "xb") as f:
+            f.write(payload)
+
+        os.replace(tmp_path, path)
         logger.info(f"Snapshot saved successfully with {len(fixtures)} fixtures.")
 
     except Exception as e:
+        tmp_path.unlink(missing_ok=True)
         logger.exception("Failed to save snapshot")
         raise DataProcessingError("Failed to save snapshot") from e
 
@@ -75,13 +114,14 @@ def load_snapshot(path: Path) -> dict[str, dict]:
     Returns:
         A dictionary mapping fixture IDs to their snapshot dictionaries.
     """
-    if not path.exists():
-        logger.warning("Snapshot file does not exist.")
-        return {}
-
+    # Opening straight away saves a stat per snapshot over checking exists() first
     try:
         return cast(dict[str, dict], orjson.loads(path.read_bytes()))
 
+    except FileNotFoundError:
+        logger.warning("Snapshot file does not exist.")
+        return {}
+
     except orjson.JSONDecodeError as e:
         logger.error(f"Error decoding JSON from snapshot file: {e}")
         return {}
@@ -98,6 +138,12 @@ def diff_changes(current: list[Fixture], snapshot: dict[str, dict]) -> dict[str,
         A dictionary with counts of 'time', 'venue', 'tv', and 'status' changes.
     """
     counts = {"time": 0, "venue": 0, "tv": 0, "status": 0}
+
+    # A first run has no snapshot, so nothing can have changed
+    if not snapshot:
+        logger.info(f"Diff changes: {counts} (no snapshot)")
+        return counts
+
     for f in current:
         prev = snapshot.get(f.id)
         if not prev:
@@ -112,6 +158,10 @@ def diff_changes(current: list[Fixture], snapshot: dict[str, dict]) -> dict[str,
 
         prev_tuple = _dict_to_key_fields(prev)
 
+        # Most fixtures are unchanged, and one tuple compare settles those
+        if curr_tuple == prev_tuple:
+            continue
+
         if curr_tuple[0] != prev_tuple[0]:
             counts["time"] += 1
         if curr_tuple[1] != prev_tuple[1]:
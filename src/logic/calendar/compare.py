@@ -1,6 +1,8 @@
 """Compare two ICS calendar files for upcoming events"""
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
 
 from icalendar import Calendar
@@ -9,15 +11,22 @@ from utils import DataProcessingError, FFLogger, ICSReadError, as_datetime
 
 logger = FFLogger.get_logger(__name__)
 
+# Below this many files, starting worker processes costs more than parsing serially
+PARALLEL_MIN_FILES = 16
+
 
 class CalendarComparison:
     """Class to compare two ICS calendar files for upcoming events"""
 
-    def get_upcoming_events(self, ics_file: Path) -> set[tuple]:
+    def get_upcoming_events(
+        self, ics_file: Path, now: datetime | None = None
+    ) -> set[tuple]:
         """Get upcoming events from an ICS file as a tuple
 
         Args:
             ics_file: Path to the ICS file
+            now: Events starting after this are upcoming. Defaults to the current
+                time
 
         Returns:
             Set of (UID, DTSTART, DESCRIPTION) tuples for upcoming events
@@ -30,26 +39,31 @@ class CalendarComparison:
             logger.error(f"Error reading {ics_file}: {e}")
             raise ICSReadError(f"Error reading ICS file {ics_file}: {e}") from e
 
-        now = datetime.now().astimezone()
+        if now is None:
+            now = datetime.now().astimezone()
 
         upcoming_events = set()
         try:
-            for event in cal.walk():
-                if event.name == "VEVENT":
-                    dtstart = event.get("DTSTART")
-                    if dtstart is None:
-                        continue
-
-                    start = as_datetime(dtstart.dt)
-                    if start > now:
-                        upcoming_events.add(
-                            (
-                                str(event.get("UID", "")),
-                                str(start),
-                                str(event.get("DESCRIPTION", "")),
-                                str(event.get("STATUS", "")),
-                            )
-                        )
+            # walk() filters by name itself, so timezones and their
+            # STANDARD/DAYLIGHT subcomponents never reach the loop body
+            for event in cal.walk("VEVENT"):
+                dtstart = event.get("DTSTART")
+                if dtstart is None:
+                    continue
+
+                # Past events are dropped before any of their fields are read
+                start = as_datetime(dtstart.dt)
+                if start <= now:
+                    continue
+
+                upcoming_events.add(
+                    (
+                        str(event.get("UID", "")),
+                        str(start),
+                        str(event.get("DESCRIPTION", "")),
+                        str(event.get("STATUS", "")),
+                    )
+                )
 
         except Exception as e:
             logger.error(f"Error processing events in {ics_file}: {e}")
@@ -69,21 +83,50 @@ class CalendarComparison:
         Returns:
             True if upcoming events differ, False if the same
         """
-        old_signature = set()
-        new_signature = set()
+        old_files = sorted(old_dir.glob("**/*.ics"))
+        new_files = sorted(new_dir.glob("**/*.ics"))
+        files = old_files + new_files
 
-        for ics_file in sorted(old_dir.glob("**/*.ics")):
-            try:
-                old_signature.update(self.get_upcoming_events(ics_file))
+        # One cut-off for both sides, so an event kicking off mid-comparison
+        # can't be upcoming in one directory and past in the other
+        now = datetime.now().astimezone()
 
-            except (ICSReadError, DataProcessingError) as e:
-                logger.warning(f"Error processing {ics_file}: {e}")
+        # Parsing is pure-Python CPU work, so only processes sidestep the GIL
+        if len(files) >= PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor() as ex:
+                results = list(ex.map(_upcoming_events, files, repeat(now)))
 
-        for ics_file in sorted(new_dir.glob("**/*.ics")):
-            try:
-                new_signature.update(self.get_upcoming_events(ics_file))
+        else:
+            results = []
+            for ics_file in files:
+                try:
+                    results.append(self.get_upcoming_events(ics_file, now))
 
-            except (ICSReadError, DataProcessingError) as e:
-                logger.warning(f"Error processing {ics_file}: {e}")
+                except (ICSReadError, DataProcessingError) as e:
+                    logger.warning(f"Error processing {ics_file}: {e}")
+                    results.append(set())
+
+        old_signature = set().union(*results[: len(old_files)])
+        new_signature = set().union(*results[len(old_files) :])
 
         return old_signature != new_signature
+
+
+def _upcoming_events(ics_file: Path, now: datetime) -> set[tuple]:
+    """Get a file's upcoming events, treating an unreadable file as empty
+
+    Module-level so it can be sent to worker processes.
+
+    Args:
+        ics_file: Path to the ICS file
+        now: Events starting after this are upcoming
+
+    Returns:
+        Set of event tuples, or an empty set if the file could not be processed
+    """
+    try:
+        return CalendarComparison().get_upcoming_events(ics_file, now)
+
+    except (ICSReadError, DataProcessingError) as e:
+        logger.warning(f"Error processing {ics_file}: {e}")
+        return set()
@@ -12,6 +12,9 @@ logger = FFLogger.get_logger(__name__)
 
 LONDON_TZ = ZoneInfo("Europe/London")
 
+# Calendar slot for a match: 90 minutes plus half-time and stoppages
+MATCH_DURATION = timedelta(hours=2)
+
 # football-data.org match status -> RFC 5545 STATUS (section 3.8.1.11)
 # Statuses not listed here (FINISHED, IN_PLAY, etc) get no STATUS property
 ICS_STATUS = {
@@ -72,29 +75,27 @@ class EventFormatter:
 
         start = fixture.utc_kickoff.astimezone(LONDON_TZ)
         event.add("dtstart", start)
-        event.add("dtend", start + timedelta(hours=2))
+        event.add("dtend", start + MATCH_DURATION)
         event.add("summary", f"{fixture.home_team} vs {fixture.away_team}")
 
         ics_status = ICS_STATUS.get(fixture.status)
         if ics_status:
             event.add("status", ics_status)
 
-        parts = [fixture.competition_code]
-
+        # Built as one expression rather than by appending to a list of parts
         label = STATUS_LABEL.get(fixture.status)
-        if label:
-            parts.append(label)
-
-        if fixture.tv is not None:
-            parts.append(f"{fixture.tv}")
-
-        if fixture.matchday is not None:
-            parts.append(f"Matchday {fixture.matchday}")
+        matchday = fixture.matchday
+        description = (
+            fixture.competition_code
+            + (f" | {label}" if label else "")
+            + (f" | {fixture.tv}" if fixture.tv is not None else "")
+            + (f" | Matchday {matchday}" if matchday is not None else "")
+            + (f" | {fixture.venue}" if fixture.venue else "")
+        )
 
         if fixture.venue:
-            parts.append(f"{fixture.venue}")
             event.add("location", fixture.venue)
 
-        event.add("description", " | ".join(parts))
+        event.add("description", description)
 
         return event
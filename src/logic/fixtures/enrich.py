@@ -1,15 +1,36 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 import yaml
 
 from logic.fixtures.models import Fixture
-from utils import FFLogger
+from utils import FFLogger, load_yaml
 
 logger = FFLogger.get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _load_overrides(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Parse an overrides file, memoised until the file is next modified.
+
+    A build enriches every team and competition against the same file, so only
+    the first call pays for the parse. The result is shared, so callers must not
+    mutate it.
+
+    Args:
+        path_str: Path to the overrides file.
+        mtime_ns: Modification time of the file, so a rewrite invalidates the entry.
+        size: Size of the file, in case a rewrite lands within the same mtime tick.
+
+    Returns:
+        Parsed overrides, keyed by fixture ID, UID or composite key.
+    """
+    with open(path_str, "rb") as f:
+        return load_yaml(f) or {}
+
+
 def apply_overrides(fixtures: list[Fixture], overrides_path: Path) -> int:
     """Apply overrides from a YAML file to the list of fixtures.
 
@@ -24,15 +45,21 @@ def apply_overrides(fixtures: list[Fixture], overrides_path: Path) -> int:
         logger.warning("Overrides file does not exist")
         return 0
 
-    data = yaml.safe_load(overrides_path.read_text()) or {}
+    stat = overrides_path.stat()
+    data = _load_overrides(str(overrides_path), stat.st_mtime_ns, stat.st_size)
 
     # Templates from scripts/make_overrides_template.py are keyed on the calendar
     # UID so keys can be copied straight out of a subscribed feed, but files
     # written by hand tend to use the bare id. Accept either.
     by_id: dict[str, Fixture] = {}
+    # Older files key on "date:home:away"; the first fixture to match wins
+    by_comp: dict[str, Fixture] = {}
     for f in fixtures:
         by_id[f.id] = f
         by_id[f.uid] = f
+        if f.utc_kickoff is not None:
+            comp = f"{f.utc_kickoff.date()}:{f.home_team}:{f.away_team}"
+            by_comp.setdefault(comp, f)
 
     applied = 0
     for key, val in data.items():
@@ -49,18 +76,13 @@ def apply_overrides(fixtures: list[Fixture], overrides_path: Path) -> int:
             logger.debug(f"Applied TV override for fixture ID {key}: {tv}")
             continue
 
-        for f in fixtures:
-            if f.utc_kickoff is None:
-                continue
-
-            comp = f"{f.utc_kickoff.date()}:{f.home_team}:{f.away_team}"
-            if comp == key:
-                if not f.tv:
-                    applied += 1
+        f = by_comp.get(key)
+        if f is not None:
+            if not f.tv:
+                applied += 1
 
-                f.tv = tv
-                logger.debug(f"Applied TV override for fixture {comp}: {tv}")
-                break
+            f.tv = tv
+            logger.debug(f"Applied TV override for fixture {key}: {tv}")
 
     return applied
 
@@ -79,7 +101,8 @@ def enrich_all(
     Returns:
         A summary of the enrichment process.
     """
-    before_tv = sum(1 for f in fixtures if (f.tv or "").strip())
+    # isspace() answers the same question as strip() without building a string
+    before_tv = sum(1 for f in fixtures if f.tv and not f.tv.isspace())
     applied = 0
 
     if overrides_path:
@@ -90,7 +113,7 @@ def enrich_all(
         except (OSError, yaml.YAMLError, AttributeError) as e:
             logger.error(f"Failed to apply overrides: {e}")
 
-    after_tv = sum(1 for f in fixtures if (f.tv or "").strip())
+    after_tv = sum(1 for f in fixtures if f.tv and not f.tv.isspace())
 
     return {
         "tv_overrides_applied": applied,
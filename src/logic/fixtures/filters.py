@@ -10,8 +10,11 @@ from utils import DataProcessingError, FFLogger, InvalidInputError
 
 logger = FFLogger.get_logger(__name__)
 
+# Statuses for matches with a kick-off still to come
+SCHEDULED_STATUSES = frozenset({"SCHEDULED", "TIMED"})
+
 # Statuses for matches that have not been played, including those suspended/cancelled
-UPCOMING_STATUSES = ("SCHEDULED", "TIMED", "POSTPONED", "SUSPENDED", "CANCELLED")
+UPCOMING_STATUSES = SCHEDULED_STATUSES | {"POSTPONED", "SUSPENDED", "CANCELLED"}
 
 
 class Filter:
@@ -39,20 +42,37 @@ class Filter:
         Returns:
             A list of Fixture objects matching all applied filters.
         """
-        result = list(fixtures)
+        # A fixture is either home or away, so nothing can pass both
+        if home_only and away_only:
+            logger.warning("Both home_only and away_only set, no fixtures match.")
+            return []
+
+        fixtures_list = list(fixtures)
+        if not (
+            scheduled_only or upcoming_only or home_only or away_only or televised_only
+        ):
+            return fixtures_list
+
+        # One pass with every enabled check, rather than a new list per filter
+        try:
+            result = [
+                f
+                for f in fixtures_list
+                if (not scheduled_only or f.status in SCHEDULED_STATUSES)
+                and (not upcoming_only or f.status in UPCOMING_STATUSES)
+                and (not home_only or f.is_home)
+                and (not away_only or not f.is_home)
+                and (not televised_only or f.tv is not None)
+            ]
+            logger.info(f"Filtered {len(result)} of {len(fixtures_list)} fixtures.")
 
-        if scheduled_only:
-            result = Filter.only_scheduled(result)
-        if upcoming_only:
-            result = Filter.only_upcoming(result)
-        if home_only:
-            result = Filter.only_home(result)
-        if away_only:
-            result = Filter.only_away(result)
-        if televised_only:
-            result = Filter.only_televised(result)
+            return result
 
-        return result
+        except AttributeError as e:
+            logger.error(f"Error applying fixture filters: {e}")
+            raise DataProcessingError(
+                "Failed to apply fixture filters", context=e
+            ) from e
 
     @staticmethod
     def only_home(fixtures: Iterable[Fixture]) -> list[Fixture]:
@@ -116,7 +136,7 @@ class Filter:
         """
         try:
             fixtures_list = list(fixtures)
-            result = [f for f in fixtures_list if f.status in ("SCHEDULED", "TIMED")]
+            result = [f for f in fixtures_list if f.status in SCHEDULED_STATUSES]
             logger.info(
                 f"Filtered {len(result)} scheduled fixtures from {len(fixtures_list)} total fixtures."
             )
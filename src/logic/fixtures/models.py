@@ -8,7 +8,7 @@ from datetime import datetime
 UID_SUFFIX = "@fixture-fetcher"
 
 
-@dataclass
+@dataclass(slots=True)
 class Fixture:
     """Data class representing a football fixture.
 
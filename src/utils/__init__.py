@@ -26,6 +26,7 @@ from .errors import (
 )
 from .logging import FFLogger
 from .text import slugify
+from .yaml_fast import dump_yaml, load_yaml
 
 __all__ = [
     "APIError",
@@ -50,8 +51,10 @@ __all__ = [
     "UnknownAPIError",
     "ValidationError",
     "as_datetime",
+    "dump_yaml",
     "is_legible",
     "is_valid_hex",
+    "load_yaml",
     "parse_club_colors",
     "slugify",
     "text_on",
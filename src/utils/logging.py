@@ -2,11 +2,14 @@
 
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parents[2]
 
+# Log records held in memory before being written to the log file together
+LOG_BUFFER_CAPACITY = 256
+
 
 class FFLogger:
     """Centralised logging class for the application."""
@@ -56,12 +59,34 @@ class FFLogger:
             )
             file_handler.setFormatter(formatter)
 
+            # Batches file writes so a busy build isn't flushing to disk per record.
+            # Warnings and errors flush straight away so they survive a crash, and
+            # logging.shutdown flushes the rest at exit
+            buffered_file_handler = MemoryHandler(
+                LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=file_handler
+            )
+
+            # Forked workers (the calendar comparison's process pool) would otherwise
+            # inherit the unflushed buffer and write its records a second time. Any
+            # records logged between the flush and the fork are the parent's to write.
+            # Pool workers also leave via os._exit, skipping logging.shutdown, so in
+            # the child every record is written straight through rather than buffered
+            def _unbuffer_in_child() -> None:
+                buffered_file_handler.buffer.clear()
+                buffered_file_handler.flushLevel = logging.NOTSET
+
+            if hasattr(os, "register_at_fork"):
+                os.register_at_fork(
+                    before=buffered_file_handler.flush,
+                    after_in_child=_unbuffer_in_child,
+                )
+
             stream_handler = logging.StreamHandler()
             stream_handler.setFormatter(formatter)
 
             logging.basicConfig(
                 level=getattr(logging, log_level, logging.INFO),
-                handlers=[file_handler, stream_handler],
+                handlers=[buffered_file_handler, stream_handler],
             )
 
             cls._configured = True
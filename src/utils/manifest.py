@@ -15,6 +15,7 @@ from utils import (
     as_datetime,
     is_legible,
     is_valid_hex,
+    load_yaml,
     parse_club_colors,
     slugify,
     text_on,
@@ -36,8 +37,8 @@ def load_color_overrides(path: Path) -> dict[str, str]:
         Mapping of team name to a validated #RRGGBB colour.
     """
     try:
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+        with open(path, "rb") as f:
+            data = load_yaml(f) or {}
 
     except (OSError, yaml.YAMLError) as e:
         logger.warning(f"Could not read team colours from {path}: {e}")
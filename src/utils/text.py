@@ -2,14 +2,38 @@
 
 from __future__ import annotations
 
+import functools
 
+
+class _SlugTable(dict):
+    """Translation table mapping each character to its slug form.
+
+    Entries are filled in on first sight, so any Unicode character is handled and
+    the per-character work is done once per process rather than once per call.
+    """
+
+    def __missing__(self, code: int) -> str:
+        c = chr(code)
+        slug = c.lower() if c.isalnum() else "-"
+        self[code] = slug
+        return slug
+
+
+_SLUG_TABLE = _SlugTable()
+
+
+# The same few team and competition names are slugified many times per build
+@functools.lru_cache(maxsize=1024)
 def slugify(s: str) -> str:
     """Convert a club name to a slug format
 
+    Each alphanumeric character is lowercased and every other character becomes a
+    dash. Runs of dashes are kept, as existing slugs and feed URLs depend on them.
+
     Args:
         s: Input string to convert
 
     Returns:
         Slugified string
     """
-    return "".join(c.lower() if c.isalnum() else "-" for c in s).strip("-")
+    return s.translate(_SLUG_TABLE).strip("-")
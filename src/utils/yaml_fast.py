@@ -0,0 +1,47 @@
+"""YAML helpers shared across the app."""
+
+from __future__ import annotations
+
+from typing import IO, Any
+
+import yaml
+
+# libyaml's C loader and dumper are several times faster than the pure-Python
+# ones and accept the same documents
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+
+def load_yaml(stream: str | bytes | IO) -> Any:
+    """Parse a YAML document with the fastest available safe loader.
+
+    Args:
+        stream: YAML text, bytes or an open file. Binary files are preferred so
+            libyaml can skip the decode step.
+
+    Returns:
+        The parsed document.
+
+    Raises:
+        yaml.YAMLError: If the document is malformed.
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump_yaml(data: Any, **kwargs: Any) -> str:
+    """Serialise data to YAML with the fastest available safe dumper.
+
+    Args:
+        data: The data to serialise.
+        **kwargs: Passed through to `yaml.dump`, e.g. `sort_keys`.
+
+    Returns:
+        The YAML document.
+
+    Raises:
+        yaml.YAMLError: If the data cannot be represented.
+    """
+    return yaml.dump(data, Dumper=SafeDumper, **kwargs)
@@ -1,14 +1,21 @@
 """Integration tests for CLI and shell modules."""
 
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+import yaml
 
-from app.cli import _slug, build, cache_teams
+from app.cli import _slug, build, cache_teams, get_team_info
 from logic.fixtures.models import Fixture
-from utils.errors import InvalidInputError, TeamNotFoundError
+from utils.errors import (
+    ConnectionError,
+    InvalidInputError,
+    TeamNotFoundError,
+    TeamsCacheError,
+)
 
 
 class TestSlugFunction:
@@ -73,6 +80,75 @@ class TestBuildFunction:
         ics_files = list(output_dir.rglob("*.ics"))
         assert len(ics_files) > 0
 
+    @patch("app.cli.get_team_info")
+    @patch("app.cli.FootballDataRepository")
+    def test_build_multiple_teams_keeps_order(
+        self, mock_repo_class, mock_get_team_info, tmp_path
+    ):
+        """Test teams built concurrently are reported in the order given."""
+        mock_repo = Mock()
+        mock_repo_class.return_value = mock_repo
+        teams = ["Arsenal", "Chelsea", "Liverpool", "Everton"]
+        mock_get_team_info.side_effect = lambda t: ("Premier League", t)
+
+        def fetch(team, comps, season):
+            if team == "Liverpool":
+                raise ConnectionError("API Error")
+
+            return [
+                Fixture(
+                    id=team,
+                    competition="Premier League",
+                    competition_code="PL",
+                    matchday=1,
+                    utc_kickoff=datetime(2099, 11, 15, 15, 0, 0, tzinfo=timezone.utc),
+                    home_team=team,
+                    away_team="Opponent",
+                    venue=None,
+                    status="SCHEDULED",
+                    tv=None,
+                    is_home=True,
+                )
+            ]
+
+        mock_repo.fetch_fixtures.side_effect = fetch
+
+        result = build(
+            teams=teams,
+            output=tmp_path / "output",
+            cache_dir=tmp_path / "cache",
+            summarise=False,
+        )
+
+        assert result["successful"] == [
+            ("Arsenal", "PL"),
+            ("Chelsea", "PL"),
+            ("Everton", "PL"),
+        ]
+        assert [name for name, _ in result["failed"]] == ["Liverpool"]
+        assert result["total"] == 4
+
+    @patch("app.cli.get_team_info")
+    @patch("app.cli.FootballDataRepository")
+    def test_build_repeated_team_built_once(
+        self, mock_repo_class, mock_get_team_info, tmp_path
+    ):
+        """Test a team named more than once is only built once."""
+        mock_repo = Mock()
+        mock_repo_class.return_value = mock_repo
+        mock_repo.fetch_fixtures.return_value = []
+        mock_get_team_info.return_value = ("Premier League", "Arsenal")
+
+        result = build(
+            teams=["Arsenal", " Arsenal ", "Arsenal"],
+            output=tmp_path / "output",
+            cache_dir=tmp_path / "cache",
+            summarise=False,
+        )
+
+        mock_repo.fetch_fixtures.assert_called_once()
+        assert result["total"] == 1
+
     @patch("app.cli.FootballDataRepository")
     def test_build_no_team_specified(self, mock_repo_class, tmp_path):
         """Test build function raises error when no team specified."""
@@ -308,6 +384,56 @@ class TestCacheTeamsFunction:
         assert call_args[1]["cache_path"] == cache_file
 
 
+class TestGetTeamInfo:
+    """Tests for the get_team_info lookup."""
+
+    @pytest.fixture
+    def teams_cache(self, tmp_path) -> Path:
+        """Write a team cache with one league.
+
+        Args:
+            tmp_path: The temporary directory path.
+
+        Returns:
+            The path to the cache file.
+        """
+        cache_file = tmp_path / "teams.yaml"
+        cache_file.write_text(
+            yaml.safe_dump(
+                {"Premier League": {"Arsenal FC": {"id": 57, "short_name": "Arsenal"}}}
+            )
+        )
+        return cache_file
+
+    def test_get_team_info(self, teams_cache):
+        """Test the league and short name are read from the cache."""
+        assert get_team_info("Arsenal FC", teams_cache) == ("Premier League", "Arsenal")
+
+    def test_get_team_info_rereads_modified_cache(self, teams_cache):
+        """Test a rewritten cache is picked up rather than served stale."""
+        get_team_info("Arsenal FC", teams_cache)
+
+        teams_cache.write_text(
+            yaml.safe_dump(
+                {"Championship": {"Arsenal FC": {"id": 57, "short_name": "Gunners"}}}
+            )
+        )
+        stat = teams_cache.stat()
+        os.utime(teams_cache, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert get_team_info("Arsenal FC", teams_cache) == ("Championship", "Gunners")
+
+    def test_get_team_info_team_not_found(self, teams_cache):
+        """Test an unknown team raises TeamNotFoundError."""
+        with pytest.raises(TeamNotFoundError):
+            get_team_info("Unknown FC", teams_cache)
+
+    def test_get_team_info_missing_cache(self, tmp_path):
+        """Test a missing cache file raises TeamsCacheError."""
+        with pytest.raises(TeamsCacheError):
+            get_team_info("Arsenal FC", tmp_path / "missing.yaml")
+
+
 class TestCLIClass:
     """Tests for the CLI class interactive shell.
 
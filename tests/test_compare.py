@@ -2,6 +2,7 @@
 
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from icalendar import Calendar, Event
@@ -128,6 +129,22 @@ class TestCalendarComparison:
 
         assert len(events) == 0
 
+    def test_get_upcoming_events_uses_given_now(
+        self, comparison, create_ics_file, tmp_path
+    ):
+        """Test the upcoming cut-off can be supplied by the caller."""
+        ics_file = tmp_path / "past.ics"
+        create_ics_file(
+            ics_file,
+            [{"uid": "past1", "summary": "Event 1", "dtstart": "past"}],
+        )
+
+        events = comparison.get_upcoming_events(
+            ics_file, now=datetime.now(timezone.utc) - timedelta(days=1)
+        )
+
+        assert len(events) == 1
+
     def test_get_upcoming_events_mixed_events(
         self, comparison, create_ics_file, tmp_path
     ):
@@ -320,6 +337,35 @@ class TestCalendarComparison:
 
         assert result is True  # Time difference detected
 
+    @pytest.mark.parametrize("changed", [True, False])
+    def test_compare_calendars_in_worker_processes(
+        self, comparison, create_ics_file, tmp_path, changed
+    ):
+        """Test the process pool path gives the same answer as the serial one."""
+        old_dir = tmp_path / "old"
+        new_dir = tmp_path / "new"
+        old_dir.mkdir()
+        new_dir.mkdir()
+
+        start = datetime.now(timezone.utc) + timedelta(days=1)
+        for i in range(3):
+            event = {"uid": f"event{i}", "summary": "Meeting", "dtstart": start}
+            create_ics_file(old_dir / f"calendar{i}.ics", [event])
+            create_ics_file(new_dir / f"calendar{i}.ics", [event])
+
+        # Unreadable files must still count as empty when read in a worker
+        (new_dir / "invalid.ics").write_text("Invalid content")
+        if changed:
+            create_ics_file(
+                new_dir / "extra.ics",
+                [{"uid": "extra", "summary": "Extra", "dtstart": start}],
+            )
+
+        with patch("logic.calendar.compare.PARALLEL_MIN_FILES", 1):
+            result = comparison.compare_calendars(old_dir, new_dir)
+
+        assert result is changed
+
     def test_compare_calendars_nested_directories(
         self, comparison, create_ics_file, tmp_path
     ):
@@ -1,5 +1,7 @@
 """Tests for the enrich module."""
 
+from unittest.mock import patch
+
 import yaml
 
 from logic.fixtures.enrich import apply_overrides, enrich_all
@@ -48,6 +50,32 @@ class TestApplyOverrides:
         assert applied == 1
         assert sample_fixtures[1].tv == "Amazon Prime"
 
+    def test_apply_overrides_parses_file_once(self, sample_fixtures, temp_yaml_file):
+        """Test an unchanged overrides file is parsed once across calls."""
+        temp_yaml_file.write_text(yaml.safe_dump({"2": {"tv": "BBC One"}}))
+
+        with patch(
+            "logic.fixtures.enrich.load_yaml", side_effect=yaml.safe_load
+        ) as mock_load:
+            apply_overrides(sample_fixtures[:2], temp_yaml_file)
+            applied = apply_overrides(sample_fixtures[2:], temp_yaml_file)
+
+        assert mock_load.call_count == 1
+        assert applied == 0
+
+    def test_apply_overrides_rereads_modified_file(
+        self, sample_fixtures, temp_yaml_file
+    ):
+        """Test a rewritten overrides file is parsed again."""
+        temp_yaml_file.write_text(yaml.safe_dump({"2": {"tv": "BBC One"}}))
+        apply_overrides(sample_fixtures, temp_yaml_file)
+
+        temp_yaml_file.write_text(yaml.safe_dump({"4": {"tv": "Sky Sports"}}))
+        applied = apply_overrides(sample_fixtures, temp_yaml_file)
+
+        assert applied == 1
+        assert sample_fixtures[3].tv == "Sky Sports"
+
     def test_apply_overrides_file_not_exists(self, sample_fixtures, tmp_path):
         """Test that non-existent file returns 0 applied."""
         non_existent = tmp_path / "does_not_exist.yaml"
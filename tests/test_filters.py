@@ -94,6 +94,11 @@ class TestFilter:
         result = Filter.apply_filters(sample_fixtures)
         assert len(result) == len(sample_fixtures)
 
+    def test_apply_filters_home_and_away(self, sample_fixtures):
+        """Test that asking for both home and away fixtures matches nothing."""
+        result = Filter.apply_filters(sample_fixtures, home_only=True, away_only=True)
+        assert result == []
+
     def test_empty_fixture_list(self):
         """Test filtering empty fixture list."""
         result = Filter.only_home([])
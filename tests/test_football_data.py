@@ -4,8 +4,9 @@ from unittest.mock import patch
 
 import pytest
 import yaml
+from requests.adapters import HTTPAdapter
 
-from backend.api.football_data import COMP_CODES, FDClient
+from backend.api.football_data import COMP_CODES, MAX_RETRIES, FDClient
 from utils.errors import (
     AuthenticationError,
     ConnectionError,
@@ -28,6 +29,21 @@ class TestFDClientInitialisation:
         assert client.token == {"X-Auth-Token": "test_token"}
         assert client.session is not None
 
+    @patch("backend.api.football_data.FOOTBALL_DATA_API_TOKEN", "test_token")
+    def test_client_session_retries_transient_errors(self):
+        """Test the session retries transient statuses and returns the last one."""
+        client = FDClient()
+        adapter = client.session.get_adapter("https://api.example")
+        assert isinstance(adapter, HTTPAdapter)
+        retry = adapter.max_retries
+
+        assert retry.total == MAX_RETRIES
+        assert retry.read is False
+        assert 429 in retry.status_forcelist
+        assert 503 in retry.status_forcelist
+        assert retry.raise_on_status is False
+        assert retry.backoff_jitter > 0
+
     @patch("backend.api.football_data.FOOTBALL_DATA_API_TOKEN", None)
     def test_client_initialisation_no_token(self):
         """Test that initialisation fails without token."""
@@ -303,6 +319,23 @@ class TestFDClientGetTeamId:
 
             assert result == 66
 
+    def test_get_team_id_reuses_name_index(
+        self, mock_api_response, competition_matches_response
+    ):
+        """Test resolving several teams from one payload builds its index once."""
+        with patch("backend.api.football_data.FOOTBALL_DATA_API_TOKEN", "test_token"):
+            client = FDClient()
+
+            mock_response = mock_api_response(200, competition_matches_response())
+
+            with patch.object(client.session, "get", return_value=mock_response):
+                home = client.get_team_id_by_name("Man United")
+                index = client._teams_by_name("PL")
+                away = client.get_team_id_by_name("Liverpool")
+
+            assert (home, away) == (66, 64)
+            assert client._teams_by_name("PL") is index
+
     def test_get_team_id_searches_all_competitions(
         self, mock_api_response, competition_matches_response
     ):
@@ -776,6 +809,21 @@ class TestFDClientCompetitionMatches:
         assert len(result) == 1
         assert result[0].id == "1"
 
+    def test_matches_are_indexed_once_per_competition(
+        self, cache_with_teams, mock_api_response, competition_matches_response
+    ):
+        """Test both sides of a match are indexed, and the index is reused."""
+        client = cache_with_teams
+        mock_response = mock_api_response(200, competition_matches_response())
+
+        with patch.object(client.session, "get", return_value=mock_response):
+            index = client._matches_by_team("PL")
+            again = client._matches_by_team("PL")
+
+        assert again is index
+        assert [m["id"] for m in index[66]] == ["1"]
+        assert [m["id"] for m in index[64]] == ["1"]
+
 
 class TestFDClientTeamIndex:
     """Tests for the team cache index."""
@@ -823,9 +871,9 @@ class TestFDClientSaveCacheErrors:
                 "Premier League": {"Manchester United": {"id": 66, "short_name": "MUN"}}
             }
 
-            # Mock yaml.safe_dump to raise YAMLError
+            # Mock dump_yaml to raise YAMLError
             with patch(
-                "backend.api.football_data.yaml.safe_dump",
+                "backend.api.football_data.dump_yaml",
                 side_effect=yaml.YAMLError("YAML error"),
             ):
                 # Should not raise, just log error
@@ -1,6 +1,9 @@
 """Tests for the snapshot module."""
 
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 import pytest
 
@@ -115,6 +118,91 @@ class TestSaveSnapshot:
         assert "1" in content
         assert "2" in content
 
+    def test_save_snapshot_leaves_no_temp_file(self, fixture_with_all_fields, tmp_path):
+        """Test the snapshot is renamed into place rather than left as a temp file."""
+        snapshot_path = tmp_path / "snapshot.json"
+
+        save_snapshot([fixture_with_all_fields], snapshot_path)
+        save_snapshot([fixture_with_all_fields], snapshot_path)
+
+        assert [p.name for p in tmp_path.iterdir()] == ["snapshot.json"]
+
+    def test_save_snapshot_concurrent_saves(
+        self, fixture_with_all_fields, fixture_without_optional_fields, tmp_path
+    ):
+        """Test concurrent saves to one path each use their own temp file."""
+        snapshot_path = tmp_path / "snapshot.json"
+        batches = [[fixture_with_all_fields], [fixture_without_optional_fields]] * 8
+
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            list(ex.map(lambda fs: save_snapshot(fs, snapshot_path), batches))
+
+        assert [p.name for p in tmp_path.iterdir()] == ["snapshot.json"]
+        assert len(load_snapshot(snapshot_path)) == 1
+
+    def test_save_snapshot_keeps_default_file_mode(
+        self, fixture_with_all_fields, tmp_path
+    ):
+        """Test the snapshot gets the same mode as any other newly created file."""
+        reference = tmp_path / "reference"
+        reference.write_bytes(b"")
+        snapshot_path = tmp_path / "snapshot.json"
+
+        save_snapshot([fixture_with_all_fields], snapshot_path)
+
+        assert stat.S_IMODE(snapshot_path.stat().st_mode) == stat.S_IMODE(
+            reference.stat().st_mode
+        )
+
+    def test_save_snapshot_skips_unchanged(self, fixture_with_all_fields, tmp_path):
+        """Test an identical snapshot is not rewritten."""
+        snapshot_path = tmp_path / "snapshot.json"
+        save_snapshot([fixture_with_all_fields], snapshot_path)
+        previous = load_snapshot(snapshot_path)
+        snapshot_path.write_bytes(b"sentinel")
+
+        save_snapshot([fixture_with_all_fields], snapshot_path, previous=previous)
+
+        assert snapshot_path.read_bytes() == b"sentinel"
+
+    def test_save_snapshot_is_canonical(
+        self, fixture_with_all_fields, fixture_without_optional_fields, tmp_path
+    ):
+        """Test fixture order doesn't change the bytes written."""
+        fixtures = [fixture_with_all_fields, fixture_without_optional_fields]
+        first = tmp_path / "first.json"
+        second = tmp_path / "second.json"
+
+        save_snapshot(fixtures, first)
+        save_snapshot(fixtures[::-1], second)
+
+        assert first.read_bytes() == second.read_bytes()
+
+    def test_save_snapshot_skips_identical_bytes(
+        self, fixture_with_all_fields, tmp_path
+    ):
+        """Test an identical snapshot is not rewritten when no previous is given."""
+        snapshot_path = tmp_path / "snapshot.json"
+        save_snapshot([fixture_with_all_fields], snapshot_path)
+        mtime = snapshot_path.stat().st_mtime_ns
+
+        with patch("backend.storage.snapshot.os.replace") as mock_replace:
+            save_snapshot([fixture_with_all_fields], snapshot_path)
+
+        mock_replace.assert_not_called()
+        assert snapshot_path.stat().st_mtime_ns == mtime
+
+    def test_save_snapshot_writes_changed(self, fixture_with_all_fields, tmp_path):
+        """Test a changed snapshot is written despite a previous one."""
+        snapshot_path = tmp_path / "snapshot.json"
+        save_snapshot([fixture_with_all_fields], snapshot_path)
+        previous = load_snapshot(snapshot_path)
+
+        fixture_with_all_fields.venue = "Stadium B"
+        save_snapshot([fixture_with_all_fields], snapshot_path, previous=previous)
+
+        assert load_snapshot(snapshot_path)["1"]["venue"] == "Stadium B"
+
 
 class TestLoadSnapshot:
     """Tests for load_snapshot function."""
@@ -20,6 +20,9 @@ class TestSlugify:
             ("", ""),
             ("---", ""),
             ("Nott'm Forest", "nott-m-forest"),
+            ("Atlético Madrid", "atlético-madrid"),
+            ("1. FC Köln", "1--fc-köln"),
+            ("ΟΛΥΜΠΙΑΚΟΣ", "ολυμπιακοσ"),
         ],
     )
     def test_slugify(self, input_name, expected):
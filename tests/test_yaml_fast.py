@@ -0,0 +1,34 @@
+"""Tests for the yaml_fast module."""
+
+import pytest
+import yaml
+
+from utils.yaml_fast import dump_yaml, load_yaml
+
+
+class TestYamlFast:
+    """Tests for the YAML load and dump helpers."""
+
+    def test_round_trip(self):
+        """Test dumped data loads back unchanged."""
+        data = {"Premier League": {"Arsenal FC": {"id": 57, "short_name": "Arsenal"}}}
+
+        assert load_yaml(dump_yaml(data)) == data
+
+    def test_load_from_binary_file(self, temp_yaml_file):
+        """Test documents can be read straight from a binary file."""
+        temp_yaml_file.write_text("123@fixture-fetcher:\n  tv: Sky Sports\n")
+
+        with open(temp_yaml_file, "rb") as f:
+            assert load_yaml(f) == {"123@fixture-fetcher": {"tv": "Sky Sports"}}
+
+    def test_dump_preserves_order_when_unsorted(self):
+        """Test sort_keys=False keeps insertion order."""
+        output = dump_yaml({"b": 1, "a": 2}, sort_keys=False)
+
+        assert output.index("b:") < output.index("a:")
+
+    def test_load_rejects_unsafe_tags(self):
+        """Test arbitrary Python objects cannot be constructed."""
+        with pytest.raises(yaml.YAMLError):
+            load_yaml("!!python/object/apply:os.system ['true']")